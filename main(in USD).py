@@ -1,24 +1,68 @@
 import sqlite3
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import namedtuple
+from datetime import date, datetime
 import tkinter as tk
 from tkinter import ttk, messagebox
 from tkcalendar import DateEntry
 
+# matplotlib is only needed for the charts, so it is imported on first use
+_plt = None
+_FigureCanvasTkAgg = None
+
+
+def load_matplotlib():
+    """Import matplotlib once and return (pyplot, FigureCanvasTkAgg)"""
+    global _plt, _FigureCanvasTkAgg
+    if _plt is None:
+        import matplotlib
+        matplotlib.use('TkAgg')
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        _plt, _FigureCanvasTkAgg = plt, FigureCanvasTkAgg
+    return _plt, _FigureCanvasTkAgg
+
+
+def month_bounds(year, month):
+    """Return the [start, end) ISO date strings covering one month"""
+    start = date(year, month, 1)
+    end = date(year + month // 12, month % 12 + 1, 1)
+    return start.isoformat(), end.isoformat()
+
+
+# Aggregates for one month, in the same order as the INR version's MonthStats
+MonthStats = namedtuple("MonthStats", "total largest count average")
+
+# month_key = year * 12 + month, computed from the ISO date text. Stored as
+# a VIRTUAL generated column only where SQLite supports those (3.31+);
+# older builds group by the expression itself.
+MONTH_KEY_EXPR = "CAST(substr(date, 1, 4) AS INTEGER) * 12 + CAST(substr(date, 6, 2) AS INTEGER)"
+HAS_GENERATED_COLUMNS = sqlite3.sqlite_version_info >= (3, 31, 0)
+
 class ExpenseTracker:
     def __init__(self, db_name="expenses.db"):
         self.db_name = db_name
         self.conn = None
         self.cursor = None
+        self.month_key = None   # month_key column, or its expression (see create_tables)
         self.connect()
         self.create_tables()
     
     def connect(self):
         """Connect to the SQLite database"""
-        self.conn = sqlite3.connect(self.db_name)
+        # timeout=5.0 is sqlite3's busy timeout: wait for main.py's writes
+        # to the same file instead of failing with "database is locked"
+        self.conn = sqlite3.connect(self.db_name, timeout=5.0, cached_statements=256)
         self.cursor = self.conn.cursor()
+        # Same settings as main.py: WAL + NORMAL sync
+        for pragma in ("journal_mode=WAL", "synchronous=NORMAL", "temp_store=MEMORY"):
+            self.cursor.execute(f"PRAGMA {pragma}")
+        # 64 MB page cache and 256 MB of memory-mapped reads; these are only
+        # tuning, so a build that rejects them keeps its defaults
+        for pragma in ("cache_size=-65536", "mmap_size=268435456"):
+            try:
+                self.cursor.execute(f"PRAGMA {pragma}")
+            except sqlite3.DatabaseError:
+                pass
     
     def create_tables(self):
         """Create necessary tables if they don't exist"""
@@ -32,6 +76,27 @@ class ExpenseTracker:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
+        # Same index main.py creates; lets date ranges seek
+        self.cursor.execute('DROP INDEX IF EXISTS idx_txn_date_cat')
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_txn_date_cat_amt
+            ON transactions (date, category, amount)
+        ''')
+        # Only the monthly trend reads month_key, so main.py leaves it out
+        self.month_key = MONTH_KEY_EXPR
+        if HAS_GENERATED_COLUMNS:
+            # table_xinfo (unlike table_info) lists generated columns
+            columns = [row[1] for row in self.cursor.execute('PRAGMA table_xinfo(transactions)')]
+            if 'month_key' not in columns:
+                self.cursor.execute(f'''
+                    ALTER TABLE transactions ADD COLUMN month_key INTEGER
+                    GENERATED ALWAYS AS ({MONTH_KEY_EXPR}) VIRTUAL
+                ''')
+            self.cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_txn_month_key
+                ON transactions (month_key, amount)
+            ''')
+            self.month_key = 'month_key'
         self.conn.commit()
     
     def add_transaction(self, date, category, amount, description=""):
@@ -54,11 +119,7 @@ class ExpenseTracker:
     
     def get_transactions_by_month(self, year, month):
         """Get transactions for a specific month"""
-        start_date = f"{year}-{month:02d}-01"
-        if month == 12:
-            end_date = f"{year+1}-01-01"
-        else:
-            end_date = f"{year}-{month+1:02d}-01"
+        start_date, end_date = month_bounds(year, month)
         
         self.cursor.execute('''
             SELECT id, date, category, amount, description 
@@ -71,11 +132,7 @@ class ExpenseTracker:
     def get_category_summary(self, year=None, month=None):
         """Get spending summary by category"""
         if year and month:
-            start_date = f"{year}-{month:02d}-01"
-            if month == 12:
-                end_date = f"{year+1}-01-01"
-            else:
-                end_date = f"{year}-{month+1:02d}-01"
+            start_date, end_date = month_bounds(year, month)
             
             self.cursor.execute('''
                 SELECT category, SUM(amount) as total
@@ -93,21 +150,68 @@ class ExpenseTracker:
             ''')
         return self.cursor.fetchall()
     
-    def get_monthly_trend(self, months=6):
-        """Get spending trend over multiple months"""
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=months*30)
+    def get_totals(self, year=None, month=None):
+        """Get (total, count) of all transactions, or of one month"""
+        if year and month:
+            start_date, end_date = month_bounds(year, month)
+            
+            self.cursor.execute('''
+                SELECT COALESCE(SUM(amount), 0), COUNT(*)
+                FROM transactions
+                WHERE date >= ? AND date < ?
+            ''', (start_date, end_date))
+        else:
+            self.cursor.execute('''
+                SELECT COALESCE(SUM(amount), 0), COUNT(*)
+                FROM transactions
+            ''')
+        return self.cursor.fetchone()
+    
+    def get_month_stats(self, year, month):
+        """Get MonthStats(total, largest, count, average) for a month in one query"""
+        start_date, end_date = month_bounds(year, month)
         
         self.cursor.execute('''
-            SELECT strftime('%Y-%m', date) as month, SUM(amount) as total
+            SELECT COALESCE(SUM(amount), 0), COALESCE(MAX(amount), 0),
+                   COUNT(*), COALESCE(AVG(amount), 0)
             FROM transactions
-            WHERE date >= ?
-            GROUP BY month
-            ORDER BY month
-        ''', (start_date.strftime('%Y-%m-%d'),))
+            WHERE date >= ? AND date < ?
+        ''', (start_date, end_date))
+        return MonthStats(*self.cursor.fetchone())
+    
+    def get_daily_spending(self, year, month):
+        """Get (date, total) per day of a month, in date order"""
+        start_date, end_date = month_bounds(year, month)
         
+        self.cursor.execute('''
+            SELECT date, SUM(amount)
+            FROM transactions
+            WHERE date >= ? AND date < ?
+            GROUP BY date
+            ORDER BY date
+        ''', (start_date, end_date))
         return self.cursor.fetchall()
     
+    def get_monthly_trend(self, months=6, today=None):
+        """Get ('YYYY-MM', total) for the last `months` calendar months up to today"""
+        # month_key is year*12 + month, so whole months are plain integer steps
+        today = today or date.today()
+        start_key = today.year * 12 + today.month - (months - 1)
+        
+        # With the month_key column, GROUP BY walks idx_txn_month_key in
+        # order: no per-row string slicing and no temp sort
+        key = self.month_key
+        self.cursor.execute(f'''
+            SELECT {key}, SUM(amount) as total
+            FROM transactions
+            WHERE {key} >= ?
+            GROUP BY {key}
+            ORDER BY {key}
+        ''', (start_key,))
+        
+        return [(f"{(key - 1) // 12}-{(key - 1) % 12 + 1:02d}", total)
+                for key, total in self.cursor.fetchall()]
+    
     def delete_transaction(self, transaction_id):
         """Delete a transaction by ID"""
         self.cursor.execute('DELETE FROM transactions WHERE id = ?', (transaction_id,))
@@ -332,38 +436,43 @@ class ExpenseTrackerGUI:
         except ValueError:
             messagebox.showerror("Error", "Invalid amount!")
     
+    def fill_tree(self, rows):
+        """Replace all table rows in one batch (tree is unpacked meanwhile)"""
+        tree = self.tree
+        tree.pack_forget()
+        
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        call, path = tree.tk.call, tree._w
+        for values in rows:
+            call(path, 'insert', '', 'end', '-values', values)
+        
+        tree.pack(fill='both', expand=True)
+    
     def refresh_transactions(self):
         """Refresh the transaction list"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
         transactions = self.tracker.get_all_transactions()
-        total = 0
-        
-        for t in transactions:
-            self.tree.insert('', 'end', values=(t[0], t[1], t[2], f'${t[3]:.2f}', t[4]))
-            total += t[3]
+        # Sum and count come from SQL; rows are formatted up front
+        total, count = self.tracker.get_totals()
+        rows = [(t[0], t[1], t[2], f'${t[3]:.2f}', t[4]) for t in transactions]
+        self.fill_tree(rows)
         
-        self.summary_label.config(text=f"Total: ${total:.2f} | Transactions: {len(transactions)}")
+        self.summary_label.config(text=f"Total: ${total:.2f} | Transactions: {count}")
     
     def filter_by_month(self):
         """Filter transactions by selected month"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
         year = self.year_var.get()
         month = self.month_var.get()
         
         transactions = self.tracker.get_transactions_by_month(year, month)
-        total = 0
-        
-        for t in transactions:
-            self.tree.insert('', 'end', values=(t[0], t[1], t[2], f'${t[3]:.2f}', t[4]))
-            total += t[3]
+        total, count = self.tracker.get_totals(year, month)
+        rows = [(t[0], t[1], t[2], f'${t[3]:.2f}', t[4]) for t in transactions]
+        self.fill_tree(rows)
         
         month_name = datetime(year, month, 1).strftime('%B %Y')
         self.summary_label.config(
-            text=f"{month_name} - Total: ${total:.2f} | Transactions: {len(transactions)}")
+            text=f"{month_name} - Total: ${total:.2f} | Transactions: {count}")
     
     def delete_selected(self):
         """Delete selected transaction"""
@@ -387,13 +496,14 @@ class ExpenseTrackerGUI:
         year = self.year_var.get()
         month = self.month_var.get()
         
-        transactions = self.tracker.get_transactions_by_month(year, month)
-        category_summary = self.tracker.get_category_summary(year, month)
+        total, _, count, _ = self.tracker.get_month_stats(year, month)
         
-        if not transactions:
+        if not count:
             messagebox.showinfo("Info", "No transactions found for this month!")
             return
         
+        category_summary = self.tracker.get_category_summary(year, month)
+        
         # Create report window
         report_win = tk.Toplevel(self.root)
         report_win.title(f"Report - {datetime(year, month, 1).strftime('%B %Y')}")
@@ -409,14 +519,13 @@ class ExpenseTrackerGUI:
                 font=('Arial', 14), bg='white', fg=self.colors['dark']).pack()
         
         # Summary
-        total = sum(t[3] for t in transactions)
         summary_frame = tk.Frame(report_win, bg='#ecf0f1', relief='solid', bd=1)
         summary_frame.pack(fill='x', padx=20, pady=20)
         
         tk.Label(summary_frame, text=f"Total Expenses: ${total:.2f}",
                 font=('Arial', 14, 'bold'), bg='#ecf0f1',
                 fg=self.colors['danger']).pack(pady=10)
-        tk.Label(summary_frame, text=f"Number of Transactions: {len(transactions)}",
+        tk.Label(summary_frame, text=f"Number of Transactions: {count}",
                 font=('Arial', 12), bg='#ecf0f1').pack(pady=5)
         
         # Category breakdown
@@ -439,9 +548,9 @@ class ExpenseTrackerGUI:
         cat_tree.column('Amount', width=150, anchor='e')
         cat_tree.column('Percentage', width=150, anchor='e')
         
+        scale = 100.0 / total if total else 0.0
         for cat, amount in category_summary:
-            percentage = (amount / total) * 100
-            cat_tree.insert('', 'end', values=(cat, f'${amount:.2f}', f'{percentage:.1f}%'))
+            cat_tree.insert('', 'end', values=(cat, f'${amount:.2f}', f'{amount * scale:.1f}%'))
         
         cat_tree.pack(fill='both', expand=True)
     
@@ -450,13 +559,17 @@ class ExpenseTrackerGUI:
         year = self.year_var.get()
         month = self.month_var.get()
         
-        transactions = self.tracker.get_transactions_by_month(year, month)
-        category_summary = self.tracker.get_category_summary(year, month)
+        total, max_transaction, count, avg_per_transaction = \
+            self.tracker.get_month_stats(year, month)
         
-        if not transactions:
+        if not count:
             messagebox.showinfo("Info", "No data to visualize for this month!")
             return
         
+        category_summary = self.tracker.get_category_summary(year, month)
+        
+        plt, FigureCanvasTkAgg = load_matplotlib()
+        
         # Create visualization window
         viz_win = tk.Toplevel(self.root)
         viz_win.title(f"Spending Analysis - {datetime(year, month, 1).strftime('%B %Y')}")
@@ -483,13 +596,8 @@ class ExpenseTrackerGUI:
         for i, v in enumerate(amounts):
             ax2.text(v, i, f' ${v:.2f}', va='center')
         
-        # 3. Daily spending
-        daily_spending = defaultdict(float)
-        for t in transactions:
-            daily_spending[t[1]] += t[3]
-        
-        dates = sorted(daily_spending.keys())
-        daily_amounts = [daily_spending[d] for d in dates]
+        # 3. Daily spending (summed per day in SQL)
+        dates, daily_amounts = zip(*self.tracker.get_daily_spending(year, month))
         
         ax3.plot(dates, daily_amounts, marker='o', linestyle='-', linewidth=2, markersize=6)
         ax3.set_xlabel('Date')
@@ -500,9 +608,6 @@ class ExpenseTrackerGUI:
         
         # 4. Statistics
         ax4.axis('off')
-        total = sum(amounts)
-        avg_per_transaction = total / len(transactions)
-        max_transaction = max(t[3] for t in transactions)
         
         stats_text = f"""
 SUMMARY STATISTICS
@@ -510,7 +615,7 @@ SUMMARY STATISTICS
 
 Total Spending:        ${total:,.2f}
 
-Transactions:          {len(transactions)}
+Transactions:          {count}
 
 Average/Transaction:   ${avg_per_transaction:.2f}
 
@@ -1,99 +1,451 @@
 # Personal-Expense-Tracker-Project 
 import sqlite3
 import csv
-from datetime import datetime, timedelta
-from collections import defaultdict
+import atexit
+import threading
+from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, namedtuple
+from operator import itemgetter
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from tkcalendar import DateEntry
 
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+CATEGORIES = ('Food', 'Transport', 'Entertainment', 'Shopping',
+              'Bills', 'Healthcare', 'Education', 'Other')
+
+# Rows fetched per step when the full history is shown in the table
+PAGE_SIZE = 200
+
+# Per-month query results kept by ExpenseTrackerDB (least recently used go first)
+MONTH_CACHE_SIZE = 32
+
+# Chart colour per category, filled in by load_matplotlib so a category
+# keeps the same colour whatever else is in the month.
+CATEGORY_COLORS = {}
+
+# Matplotlib is heavy and only needed for charts, so it is imported on
+# first use (see load_matplotlib). reportlab is imported inside export_pdf.
+_mpl = None
+
+
+def load_matplotlib():
+    """
+    Import matplotlib once and return
+    (matplotlib, Figure, FigureCanvasAgg, AutoDateLocator).
+    Charts are rasterised off-screen with Agg and shown as a Tk image, so
+    neither pyplot nor the Tk backend is needed.
+    """
+    global _mpl
+    if _mpl is None:
+        import matplotlib
+        import matplotlib.style
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.dates import AutoDateLocator
+        _mpl = (matplotlib, Figure, FigureCanvasAgg, AutoDateLocator)
+        CATEGORY_COLORS.update(zip(CATEGORIES, matplotlib.colormaps["Set3"].colors))
+    return _mpl
+
+
+def render_figure(fig, canvas):
+    """Lay out and rasterise a figure with Agg; safe to run on a worker thread."""
+    from PIL import Image
+    fig.tight_layout()
+    canvas.draw()
+    return Image.frombytes("RGBA", canvas.get_width_height(), bytes(canvas.buffer_rgba()))
 
-# PDF export (optional, handled safely if missing)
-try:
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-    from reportlab.lib import colors
-    from reportlab.lib.pagesizes import A4, landscape
-    from reportlab.lib.styles import getSampleStyleSheet
-    REPORTLAB_AVAILABLE = True
-except Exception:
-    REPORTLAB_AVAILABLE = False
 
 #  BACKEND: DATABASE LAYER
 
 
+def month_bounds(year, month):
+    """Return the [start, end) ISO date strings covering one month."""
+    start = date(year, month, 1)
+    end = date(year + month // 12, month % 12 + 1, 1)
+    return start.isoformat(), end.isoformat()
+
+
+# Aggregates for one month, computed in a single SQL pass
+MonthStats = namedtuple("MonthStats", "total largest count average")
+
+
+def parse_csv_rows(f):
+    """
+    Read (date, category, amount, description) rows from a CSV laid out
+    like Export CSV writes it. Applies the same checks as the entry form;
+    raises ValueError naming the first bad line.
+    """
+    rows = []
+    reader = csv.DictReader(f)
+    for r in reader:
+        try:
+            day = date.fromisoformat(r["Date"].strip()).isoformat()
+            amount = float(r["Amount (₹)"].strip().lstrip("₹").replace(",", ""))
+            category = r["Category"]
+        except (KeyError, AttributeError, ValueError) as e:
+            raise ValueError(f"line {reader.line_num}: {e}") from None
+        if not 0 < amount < float("inf"):     # also rejects nan
+            raise ValueError(f"line {reader.line_num}: amount must be positive")
+        rows.append((day, category, amount, r.get("Description") or ""))
+    return rows
+
+
+# SQL text lives in module constants so every call passes the same string
+# object and hits sqlite3's prepared-statement cache.
+SQL_CREATE_TABLE = '''
+    CREATE TABLE IF NOT EXISTS transactions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        date TEXT NOT NULL,
+        category TEXT NOT NULL,
+        amount REAL NOT NULL,
+        description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+# Month filters are date ranges, often grouped by category. With amount
+# included the index is covering: month totals, stats and category
+# summaries never touch the table. It replaces the older (date, category)
+# index, and also serves plain date lookups.
+SQL_DROP_OLD_INDEX = 'DROP INDEX IF EXISTS idx_txn_date_cat'
+SQL_CREATE_INDEX = '''
+    CREATE INDEX IF NOT EXISTS idx_txn_date_cat_amt
+    ON transactions (date, category, amount)
+'''
+SQL_INSERT = '''
+    INSERT INTO transactions (date, category, amount, description)
+    VALUES (?, ?, ?, ?)
+'''
+# Bulk inserts send INSERT_CHUNK rows per statement (4 parameters each,
+# well under SQLite's 999 bound-parameter limit on older builds)
+INSERT_CHUNK = 100
+SQL_INSERT_CHUNK = (
+    "INSERT INTO transactions (date, category, amount, description) VALUES "
+    + ", ".join(["(?, ?, ?, ?)"] * INSERT_CHUNK)
+)
+SQL_UPDATE = '''
+    UPDATE transactions
+    SET date=?, category=?, amount=?, description=?
+    WHERE id=?
+'''
+SQL_DELETE = 'DELETE FROM transactions WHERE id = ?'
+SQL_SELECT_ONE = '''
+    SELECT id, date, category, amount, description
+    FROM transactions
+    WHERE id = ?
+'''
+SQL_SELECT_ALL = '''
+    SELECT id, date, category, amount, description
+    FROM transactions
+    ORDER BY date DESC, id DESC
+'''
+# id breaks date ties so pages never overlap or skip rows
+SQL_SELECT_PAGE = '''
+    SELECT id, date, category, amount, description
+    FROM transactions
+    ORDER BY date DESC, id DESC
+    LIMIT ? OFFSET ?
+'''
+SQL_SELECT_MONTH = '''
+    SELECT id, date, category, amount, description
+    FROM transactions
+    WHERE date >= ? AND date < ?
+    ORDER BY date DESC
+'''
+SQL_SEARCH = '''
+    SELECT id, date, category, amount, description
+    FROM transactions
+    WHERE LOWER(category) LIKE ? OR LOWER(description) LIKE ?
+    ORDER BY date DESC
+'''
+SQL_TOTALS = '''
+    SELECT COALESCE(SUM(amount), 0), COUNT(*)
+    FROM transactions
+'''
+SQL_TOTALS_MONTH = '''
+    SELECT COALESCE(SUM(amount), 0), COUNT(*)
+    FROM transactions
+    WHERE date >= ? AND date < ?
+'''
+SQL_MONTH_STATS = '''
+    SELECT COALESCE(SUM(amount), 0), COALESCE(MAX(amount), 0),
+           COUNT(*), COALESCE(AVG(amount), 0)
+    FROM transactions
+    WHERE date >= ? AND date < ?
+'''
+SQL_DAILY_TOTALS = '''
+    SELECT date, SUM(amount)
+    FROM transactions
+    WHERE date >= ? AND date < ?
+    GROUP BY date
+    ORDER BY date
+'''
+SQL_CAT_SUMMARY = '''
+    SELECT category, SUM(amount) as total
+    FROM transactions
+    GROUP BY category
+    ORDER BY total DESC
+'''
+SQL_CAT_SUMMARY_MONTH = '''
+    SELECT category, SUM(amount) as total
+    FROM transactions
+    WHERE date >= ? AND date < ?
+    GROUP BY category
+    ORDER BY total DESC
+'''
+
+# Category breakdown plus grand total and row count, one range scan
+SQL_MONTH_REPORT = '''
+    WITH m AS (
+        SELECT category, amount
+        FROM transactions
+        WHERE date >= ? AND date < ?
+    )
+    SELECT category, SUM(amount) as total,
+           (SELECT SUM(amount) FROM m), (SELECT COUNT(*) FROM m)
+    FROM m
+    GROUP BY category
+    ORDER BY total DESC
+'''
+
+
 class ExpenseTrackerDB:
     """
     Handles all database operations:
     - create table
     - add, update, delete transactions
     - fetch all, fetch by month, search
+
+    The connection may be used from worker threads (see the GUI's I/O pool);
+    every statement runs under self._lock since they share one cursor.
+    Single statements go through _exec/_fetchone/_fetchall; the lock is an
+    RLock so multi-statement methods can hold it around those helpers.
+    The connection is in autocommit mode: single statements commit on their
+    own and multi-row writes open an explicit BEGIN ... COMMIT.
     """
-    def __init__(self, db_name="expenses.db"):
+    __slots__ = ("db_name", "fast", "conn", "cursor", "_lock",
+                 "_month_cache", "_cache_data_version", "_version")
+
+    def __init__(self, db_name="expenses.db", fast=False, create=True):
+        """
+        fast=True trades durability for speed on file DBs (on ":memory:"
+        only synchronous changes). create=False skips the schema, for a
+        connection that gets it another way (e.g. backup from a template).
+        """
         self.db_name = db_name
-        self.conn = sqlite3.connect(self.db_name)
+        self.fast = fast
+        self.conn = None
+        self.cursor = None
+        self._lock = threading.RLock()
+        # (sql, year, month) -> rows, LRU-ordered; cleared on every write
+        # and whenever another connection commits (see _month_rows)
+        self._month_cache = OrderedDict()
+        self._cache_data_version = None
+        self._version = 0           # bumped on every write, see data_signature
+        self.connect()
+        if create:
+            self.create_tables()
+        # Close cleanly even if the GUI never reaches on_closing
+        atexit.register(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def connect(self):
+        """Connect to the SQLite database and apply write-friendly PRAGMAs."""
+        # timeout is the busy timeout (PRAGMA busy_timeout=5000): the USD
+        # script shares expenses.db, so wait on its locks instead of failing
+        self.conn = sqlite3.connect(self.db_name, timeout=5.0, check_same_thread=False,
+                                    cached_statements=256, isolation_level=None)
         self.cursor = self.conn.cursor()
-        self.create_tables()
+        # WAL + synchronous=NORMAL: a commit no longer forces a full fsync
+        self.cursor.execute("PRAGMA journal_mode=WAL")
+        self.cursor.execute("PRAGMA synchronous=NORMAL")
+        self.cursor.execute("PRAGMA temp_store=MEMORY")
+        # 64 MB page cache and 256 MB of memory-mapped reads; these are only
+        # tuning, so a build that rejects them keeps its defaults
+        for pragma in ("PRAGMA cache_size=-65536", "PRAGMA mmap_size=268435456"):
+            try:
+                self.cursor.execute(pragma)
+            except sqlite3.DatabaseError:
+                pass
+        if self.fast:
+            # No journal file and no fsync at all: a crash may lose the DB
+            self.cursor.execute("PRAGMA journal_mode=MEMORY")
+            self.cursor.execute("PRAGMA synchronous=OFF")
+
+    def _exec(self, sql, params=()):
+        """Run one statement on the shared cursor; return its rowcount."""
+        with self._lock:
+            return self.cursor.execute(sql, params).rowcount
+
+    def _fetchone(self, sql, params=()):
+        """Run a query on the shared cursor and return its first row."""
+        with self._lock:
+            return self.cursor.execute(sql, params).fetchone()
+
+    def _fetchall(self, sql, params=()):
+        """Run a query on the shared cursor and return all rows."""
+        with self._lock:
+            return self.cursor.execute(sql, params).fetchall()
 
     def create_tables(self):
         """Create the transactions table if it doesn't exist."""
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS transactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL,
-                category TEXT NOT NULL,
-                amount REAL NOT NULL,
-                description TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        self.conn.commit()
+        with self._lock:
+            self.create_tables_static(self.conn)
+
+    @staticmethod
+    def create_tables_static(conn):
+        """Create the schema on any sqlite3 connection (e.g. a test template)."""
+        conn.execute(SQL_CREATE_TABLE)
+        conn.execute(SQL_DROP_OLD_INDEX)
+        conn.execute(SQL_CREATE_INDEX)
+        # Refresh planner statistics so the index is picked up
+        conn.execute("ANALYZE")
 
     def add_transaction(self, date, category, amount, description=""):
-        """Insert a new transaction row."""
-        self.cursor.execute('''
-            INSERT INTO transactions (date, category, amount, description)
-            VALUES (?, ?, ?, ?)
-        ''', (date, category, amount, description))
-        self.conn.commit()
-        return self.cursor.lastrowid
+        """Insert a new transaction row and return its ID."""
+        with self._lock:
+            self._insert_rows([(date, category, amount, description)])
+            return self._fetchone("SELECT last_insert_rowid()")[0]
+
+    def add_transactions(self, rows):
+        """
+        Insert many (date, category, amount, description) rows at once.
+        All rows share one transaction (one commit); returns the row count.
+        """
+        with self._lock:
+            count = self._insert_rows(rows)
+            # A large import changes the data shape; refresh planner stats
+            if count >= INSERT_CHUNK:
+                self._exec("ANALYZE")
+            return count
+
+    def _insert_rows(self, rows):
+        """
+        Insert rows inside a single BEGIN/COMMIT. Caller holds self._lock.
+        Full chunks go out as one multi-VALUES statement each; the tail
+        (and single-row adds) use executemany.
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        full = len(rows) - len(rows) % INSERT_CHUNK
+        self._invalidate()
+        cursor, conn = self.cursor, self.conn
+        cursor.execute("BEGIN")
+        try:
+            for i in range(0, full, INSERT_CHUNK):
+                params = []
+                for row in rows[i:i + INSERT_CHUNK]:
+                    # A short or long row would shift every later row's columns
+                    if len(row) != 4:
+                        raise ValueError(f"expected (date, category, amount, description), got {row!r}")
+                    params.extend(row)
+                cursor.execute(SQL_INSERT_CHUNK, params)
+            if full < len(rows):
+                cursor.executemany(SQL_INSERT, rows[full:])
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+        return len(rows)
 
     def update_transaction(self, trans_id, date, category, amount, description=""):
         """Update an existing transaction by ID."""
-        self.cursor.execute('''
-            UPDATE transactions
-            SET date=?, category=?, amount=?, description=?
-            WHERE id=?
-        ''', (date, category, amount, description, trans_id))
-        self.conn.commit()
-        return self.cursor.rowcount
+        with self._lock:
+            self._invalidate()
+            return self._exec(SQL_UPDATE, (date, category, amount, description, trans_id))
+
+    def get_transaction(self, trans_id):
+        """Fetch a single transaction by ID (None if missing)."""
+        return self._fetchone(SQL_SELECT_ONE, (trans_id,))
 
     def get_all_transactions(self):
         """Fetch all transactions sorted by date (newest first)."""
-        self.cursor.execute('''
-            SELECT id, date, category, amount, description
-            FROM transactions
-            ORDER BY date DESC
-        ''')
-        return self.cursor.fetchall()
+        return self._fetchall(SQL_SELECT_ALL)
+
+    def iter_all_transactions(self, chunk=1000):
+        """
+        Yield every transaction, newest first, `chunk` rows at a time.
+        Uses its own cursor so other queries can run between chunks.
+        """
+        cursor = self.conn.cursor()
+        try:
+            with self._lock:
+                cursor.execute(SQL_SELECT_ALL)
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(chunk)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    def get_transactions_page(self, limit, offset=0):
+        """Fetch one page of transactions, newest first (limit=-1 for the rest)."""
+        return self._fetchall(SQL_SELECT_PAGE, (limit, offset))
+
+    def _month_rows(self, sql, year, month):
+        """
+        Run a per-month query, or return its rows from the month cache.
+        Report, chart and filter all ask for the same months, so repeat
+        clicks cost nothing until the next write. Callers must not mutate
+        the returned list.
+        """
+        key = (sql, year, month)
+        cache = self._month_cache
+        with self._lock:
+            # Commits from other connections (the USD script shares the
+            # file) move PRAGMA data_version; cached rows predate them
+            data_version = self._fetchone("PRAGMA data_version")[0]
+            if data_version != self._cache_data_version:
+                cache.clear()
+                self._cache_data_version = data_version
+            rows = cache.get(key)
+            if rows is None:
+                rows = cache[key] = self._fetchall(sql, month_bounds(year, month))
+                if len(cache) > MONTH_CACHE_SIZE:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(key)
+            return rows
+
+    def _invalidate(self):
+        """Drop cached month results after a write. Caller holds self._lock."""
+        self._month_cache.clear()
+        self._version += 1
+
+    def data_signature(self):
+        """
+        Cheap token that changes whenever the data may have changed: our
+        own writes bump _version, and PRAGMA data_version moves when
+        another connection (e.g. the USD script) commits to the file.
+        """
+        return self._version, self._fetchone("PRAGMA data_version")[0]
 
     def get_transactions_by_month(self, year, month):
         """Fetch all transactions for a specific month and year."""
-        start_date = f"{year}-{month:02d}-01"
-        if month == 12:
-            end_date = f"{year+1}-01-01"
-        else:
-            end_date = f"{year}-{month+1:02d}-01"
+        return self._month_rows(SQL_SELECT_MONTH, year, month)
+
+    def get_totals(self):
+        """Return (sum of amounts, row count) over all transactions."""
+        return self._fetchone(SQL_TOTALS)
 
-        self.cursor.execute('''
-            SELECT id, date, category, amount, description
-            FROM transactions
-            WHERE date >= ? AND date < ?
-            ORDER BY date DESC
-        ''', (start_date, end_date))
-        return self.cursor.fetchall()
+    def get_totals_by_month(self, year, month):
+        """Return (sum of amounts, row count) for a specific month and year."""
+        return self._month_rows(SQL_TOTALS_MONTH, year, month)[0]
+
+    def get_month_stats(self, year, month):
+        """Return MonthStats(total, largest, count, average) for a month."""
+        return MonthStats(*self._month_rows(SQL_MONTH_STATS, year, month)[0])
+
+    def get_daily_totals(self, year, month):
+        """Return [(date, total spent that day), ...] for a month, oldest first."""
+        return self._month_rows(SQL_DAILY_TOTALS, year, month)
 
     def get_category_summary(self, year=None, month=None):
         """
@@ -102,49 +454,75 @@ class ExpenseTrackerDB:
         - all data if year/month not provided.
         """
         if year and month:
-            start_date = f"{year}-{month:02d}-01"
-            if month == 12:
-                end_date = f"{year+1}-01-01"
-            else:
-                end_date = f"{year}-{month+1:02d}-01"
-
-            self.cursor.execute('''
-                SELECT category, SUM(amount) as total
-                FROM transactions
-                WHERE date >= ? AND date < ?
-                GROUP BY category
-                ORDER BY total DESC
-            ''', (start_date, end_date))
-        else:
-            self.cursor.execute('''
-                SELECT category, SUM(amount) as total
-                FROM transactions
-                GROUP BY category
-                ORDER BY total DESC
-            ''')
-        return self.cursor.fetchall()
+            return self._month_rows(SQL_CAT_SUMMARY_MONTH, year, month)
+        return self._fetchall(SQL_CAT_SUMMARY)
+
+    def get_month_snapshot(self, year, month):
+        """
+        Return (category summary, daily totals, MonthStats) for a month,
+        read inside one BEGIN ... COMMIT so all three see the same data.
+        Bypasses the month cache, whose entries may predate the snapshot.
+        """
+        bounds = month_bounds(year, month)
+        with self._lock:
+            self._exec("BEGIN")
+            try:
+                summary = self._fetchall(SQL_CAT_SUMMARY_MONTH, bounds)
+                daily = self._fetchall(SQL_DAILY_TOTALS, bounds)
+                stats = self._fetchone(SQL_MONTH_STATS, bounds)
+            finally:
+                # Read-only, so COMMIT only ends the snapshot
+                self._exec("COMMIT")
+        return summary, daily, MonthStats(*stats)
+
+    def get_month_report(self, year, month):
+        """
+        Return (grand_total, count, [(category, total), ...]) for a month,
+        all from a single query. An empty month gives (0, 0, []).
+        """
+        rows = self._month_rows(SQL_MONTH_REPORT, year, month)
+        if not rows:
+            return 0, 0, []
+        return rows[0][2], rows[0][3], [(cat, total) for cat, total, _, _ in rows]
 
     def delete_transaction(self, trans_id):
         """Delete a transaction by ID."""
-        self.cursor.execute('DELETE FROM transactions WHERE id = ?', (trans_id,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        with self._lock:
+            self._invalidate()
+            return self._exec(SQL_DELETE, (trans_id,)) > 0
+
+    def delete_transactions(self, ids):
+        """Delete several transactions in one transaction; return rows removed."""
+        params = [(trans_id,) for trans_id in ids]
+        if not params:
+            return 0
+        # executemany on the constant SQL_DELETE reuses one prepared
+        # statement; an IN (?, ?, ...) list would be new SQL for every size
+        cursor, conn = self.cursor, self.conn
+        with self._lock:
+            self._invalidate()
+            cursor.execute("BEGIN")
+            try:
+                cursor.executemany(SQL_DELETE, params)
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
+            return cursor.rowcount
 
     def search(self, keyword):
         """Simple search by category or description (case-insensitive)."""
         key = f"%{keyword.lower()}%"
-        self.cursor.execute('''
-            SELECT id, date, category, amount, description
-            FROM transactions
-            WHERE LOWER(category) LIKE ? OR LOWER(description) LIKE ?
-            ORDER BY date DESC
-        ''', (key, key))
-        return self.cursor.fetchall()
+        return self._fetchall(SQL_SEARCH, (key, key))
 
     def close(self):
-        """Close database connection."""
+        """Close database connection (safe to call more than once)."""
+        # Drop the atexit hook too, or the registry keeps this object alive
+        atexit.unregister(self.close)
         if self.conn:
-            self.conn.close()
+            with self._lock:
+                self.conn.close()
+                self.conn = None
 
 
 class ExpenseTrackerGUI:
@@ -160,9 +538,34 @@ class ExpenseTrackerGUI:
         self.root.geometry("1200x700")
 
         self.db = ExpenseTrackerDB()
+        # Runs independent DB queries in parallel with window setup
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
         self.editing_id = None      # will store the ID when editing a record
+        self._loaded = 0            # rows of the paged "all" view in the table
+        self._more_rows = False     # more pages left to fetch on scroll
+        self._refresh_job = None    # pending after() id from schedule_refresh
+        self._view_sig = None       # (view, data signature) the table shows
         self.dark_mode = False      # theme flag
 
+        # Report / chart windows are built once and reused on later clicks
+        self._report_win = None
+        self._report_tree = None
+        self._viz_win = None
+        self._viz_fig = None
+        self._viz_canvas = None
+        self._viz_axes = None
+        self._viz_line = None       # daily spending Line2D, updated via set_data
+        self._viz_stats = None      # summary statistics Text artist
+        self._viz_bars = None       # (categories, bar patches, value labels)
+        self._viz_dark = None       # theme the chart figure was built with
+        self._viz_key = None        # data currently drawn in the chart window
+        self._viz_label = None      # shows the rendered chart image
+        self._viz_image = None      # PhotoImage kept alive for the label
+        self._viz_size = None       # pixel size of the last render
+        self._viz_job = None        # draw/render on the I/O pool, until shown
+        self._viz_redraw = False    # Visualize clicked while a job was pending
+        self._viz_resize_job = None
+
         # Color themes
         self.light_colors = {
             "bg": "#f0f0f0",
@@ -213,7 +616,8 @@ class ExpenseTrackerGUI:
         tk.Button(top_right, text="Search", command=self.search_records).pack(side='left', padx=2)
         tk.Button(top_right, text="Clear", command=self.clear_search).pack(side='left', padx=2)
 
-        # Export buttons
+        # Import / Export buttons
+        tk.Button(top_right, text="Import CSV", command=self.import_csv).pack(side='left', padx=4)
         tk.Button(top_right, text="Export CSV", command=self.export_csv).pack(side='left', padx=4)
         tk.Button(top_right, text="Export PDF", command=self.export_pdf).pack(side='left', padx=4)
 
@@ -251,11 +655,9 @@ class ExpenseTrackerGUI:
         # Category
         tk.Label(self.add_frame, text="Category:", font=('Arial', 10)).grid(row=1, column=0, sticky='w', pady=5)
         self.category_var = tk.StringVar()
-        categories = ['Food', 'Transport', 'Entertainment', 'Shopping',
-                      'Bills', 'Healthcare', 'Education', 'Other']
         self.category_combo = ttk.Combobox(
             self.add_frame, textvariable=self.category_var,
-            values=categories, width=18, state='readonly'
+            values=CATEGORIES, width=18, state='readonly'
         )
         self.category_combo.grid(row=1, column=1, pady=5, sticky='ew')
         self.category_combo.set('Food')
@@ -348,7 +750,7 @@ class ExpenseTrackerGUI:
         tree_frame = tk.Frame(self.right_panel)
         tree_frame.pack(fill='both', expand=True, padx=10, pady=5)
 
-        tree_scroll_y = tk.Scrollbar(tree_frame)
+        self.tree_scroll_y = tree_scroll_y = tk.Scrollbar(tree_frame)
         tree_scroll_y.pack(side='right', fill='y')
 
         tree_scroll_x = tk.Scrollbar(tree_frame, orient='horizontal')
@@ -358,7 +760,7 @@ class ExpenseTrackerGUI:
             tree_frame,
             columns=('ID', 'Date', 'Category', 'Amount', 'Description'),
             show='headings',
-            yscrollcommand=tree_scroll_y.set,
+            yscrollcommand=self.on_tree_scroll,
             xscrollcommand=tree_scroll_x.set
         )
 
@@ -416,6 +818,23 @@ class ExpenseTrackerGUI:
             foreground=header_fg
         )
 
+    def fill_tree(self, tree, rows):
+        """
+        Replace all rows of a Treeview in one batch.
+        The tree is unpacked while filling so Tk lays it out once, and rows
+        go straight to the Tcl 'insert' command to skip ttk's option parsing.
+        The tree must be the last widget packed in its parent.
+        """
+        pack_info = tree.pack_info()
+        tree.pack_forget()
+
+        tree.delete(*tree.get_children())
+        call, path = tree.tk.call, tree._w
+        for values in rows:
+            call(path, 'insert', '', 'end', '-values', values)
+
+        tree.pack(**pack_info)
+
     def apply_theme(self):
         """Apply current color theme to major widgets."""
         c = self.colors
@@ -493,45 +912,131 @@ class ExpenseTrackerGUI:
             messagebox.showinfo("Success", "Transaction added successfully.")
 
         self.clear_form()
-        self.refresh_transactions()
+        self.schedule_refresh()
 
-    def refresh_transactions(self, rows=None):
-        """Refresh the TreeView with all or given rows."""
-        # Clear table
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+    def schedule_refresh(self, delay=100):
+        """
+        Refresh the full list after `delay` ms, coalescing repeated calls.
+        Used after writes so a burst of adds/deletes costs one rebuild.
+        """
+        if self._refresh_job is not None:
+            self.root.after_cancel(self._refresh_job)
+        self._refresh_job = self.root.after(delay, self.refresh_transactions)
 
+    def refresh_transactions(self, rows=None, totals=None, view_sig=None):
+        """
+        Refresh the TreeView with all or given rows.
+        totals is an optional (sum, count) pair already computed in SQL.
+        view_sig is what given rows show (see view_signature), taken before
+        they were read; None for ad-hoc results such as search, which
+        always rebuild.
+        """
+        # An explicit refresh (filter, search) supersedes a pending one
+        if self._refresh_job is not None:
+            self.root.after_cancel(self._refresh_job)
+            self._refresh_job = None
         if rows is None:
-            rows = self.db.get_all_transactions()
+            view_sig = self.view_signature("all")
+            if view_sig == self._view_sig:
+                return
+            # Full history: load the first page, the rest follows on scroll
+            rows = self.db.get_transactions_page(PAGE_SIZE)
+            totals = self.db.get_totals()
+            self._more_rows = len(rows) == PAGE_SIZE
+        else:
+            self._more_rows = False
+            if totals is None:
+                totals = (sum(map(itemgetter(3), rows)), len(rows))
+        self._loaded = len(rows)
 
-        total = 0
-        for t in rows:
-            self.tree.insert('', 'end', values=(t[0], t[1], t[2], f'₹{t[3]:.2f}', t[4]))
-            total += t[3]
+        self._view_sig = None
+        self.fill_tree(self.tree, self.format_rows(rows))
 
-        self.summary_label.config(text=f"Total: ₹{total:.2f} | Transactions: {len(rows)}")
+        total, count = totals
+        self.summary_label.config(text=f"Total: ₹{total:.2f} | Transactions: {count}")
+        # Only now does the table really show view_sig
+        self._view_sig = view_sig
+
+    def view_signature(self, view):
+        """
+        (view, data signature): equal to _view_sig while the table shows
+        `view` and the data has not changed since it was loaded.
+        """
+        return view, self.db.data_signature()
+
+    def selected_month(self):
+        """(year, month) from the filter spinboxes, or None after an error."""
+        try:
+            year, month = int(self.year_var.get()), int(self.month_var.get())
+        except (tk.TclError, ValueError):
+            year = month = None
+        if month is None or not 1 <= month <= 12 or not 1 <= year < 9999:
+            messagebox.showerror("Error", "Please enter a valid month (1-12) and year.")
+            return None
+        return year, month
+
+    @staticmethod
+    def format_rows(rows):
+        """
+        Yield table values with the amount formatted for display. Every
+        view and export goes through here: SQLite's printf rounds halves
+        differently (2.675 -> 2.68), so the same row would read differently.
+        """
+        fmt = "₹{:.2f}".format
+        return ((tid, day, cat, fmt(amt), desc) for tid, day, cat, amt, desc in rows)
+
+    def append_rows(self):
+        """Append the next page of the full history to the table."""
+        rows = self.db.get_transactions_page(PAGE_SIZE, self._loaded)
+        self._loaded += len(rows)
+        self._more_rows = len(rows) == PAGE_SIZE
+
+        call, path = self.tree.tk.call, self.tree._w
+        for values in self.format_rows(rows):
+            call(path, 'insert', '', 'end', '-values', values)
+
+    def view_rows(self):
+        """Rows of the current view as the table shows them, for export."""
+        if self._more_rows:
+            # Paged full history: stream it from SQLite rather than
+            # loading every remaining page into the table first
+            return self.format_rows(self.db.iter_all_transactions())
+        return (self.tree.item(iid)["values"] for iid in self.tree.get_children())
+
+    def on_tree_scroll(self, first, last):
+        """Table yscrollcommand: move the scrollbar, fetch more near the end."""
+        self.tree_scroll_y.set(first, last)
+        if self._more_rows and float(last) > 0.9:
+            self.append_rows()
 
     def filter_by_month(self):
         """Filter transactions by month/year from spinboxes."""
-        year = int(self.year_var.get())
-        month = int(self.month_var.get())
+        selected = self.selected_month()
+        if selected is None:
+            return
+        year, month = selected
+        view_sig = self.view_signature(("month", year, month))
+        if view_sig == self._view_sig:
+            return      # same month, no writes since: keep the table as is
         rows = self.db.get_transactions_by_month(year, month)
-        self.refresh_transactions(rows)
+        self.refresh_transactions(rows, self.db.get_totals_by_month(year, month), view_sig)
 
     def delete_selected(self):
-        """Delete selected row from the table and DB."""
+        """Delete the selected rows from the table and DB."""
         selected = self.tree.selection()
         if not selected:
             messagebox.showwarning("Warning", "Please select a transaction to delete!")
             return
 
-        item = self.tree.item(selected[0])
-        trans_id = item['values'][0]
+        ids = [self.tree.item(iid)['values'][0] for iid in selected]
+        what = "this transaction" if len(ids) == 1 else f"these {len(ids)} transactions"
 
-        if messagebox.askyesno("Confirm", "Are you sure you want to delete this transaction?"):
-            if self.db.delete_transaction(trans_id):
-                messagebox.showinfo("Success", "Transaction deleted!")
-                self.refresh_transactions()
+        if messagebox.askyesno("Confirm", f"Are you sure you want to delete {what}?"):
+            # One transaction, one commit, however many rows are selected
+            if self.db.delete_transactions(ids):
+                messagebox.showinfo("Success", "Transaction deleted!" if len(ids) == 1
+                                    else f"{len(ids)} transactions deleted!")
+                self.schedule_refresh()
             else:
                 messagebox.showerror("Error", "Could not delete transaction!")
 
@@ -546,10 +1051,7 @@ class ExpenseTrackerGUI:
         trans_id = values[0]
 
         # Fetch row from DB 
-        record = self.db.cursor.execute(
-            "SELECT id, date, category, amount, description FROM transactions WHERE id=?",
-            (trans_id,)
-        ).fetchone()
+        record = self.db.get_transaction(trans_id)
 
         if not record:
             messagebox.showerror("Error", "Could not fetch transaction from database!")
@@ -588,34 +1090,60 @@ class ExpenseTrackerGUI:
 
     def show_monthly_report(self):
         """Show monthly summary (total + category breakdown)."""
-        year = int(self.year_var.get())
-        month = int(self.month_var.get())
-
-        transactions = self.db.get_transactions_by_month(year, month)
-        category_summary = self.db.get_category_summary(year, month)
+        selected = self.selected_month()
+        if selected is None:
+            return
+        year, month = selected
 
-        if not transactions:
+        # Total, count and category breakdown come from one query
+        total, count, category_summary = self.db.get_month_report(year, month)
+        if not count:
             messagebox.showinfo("Info", "No transactions found for this month!")
             return
 
+        month_name = datetime(year, month, 1).strftime('%B %Y')
+
+        if self._report_win is None or not self._report_win.winfo_exists():
+            self.build_report_window()
+        else:
+            self._report_win.deiconify()
+            self._report_win.lift()
+
+        self._report_win.title(f"Report - {month_name}")
+        self._report_month_label.configure(text=month_name)
+        self._report_total_label.configure(text=f"Total Expenses: ₹{total:.2f}")
+        self._report_count_label.configure(text=f"Number of Transactions: {count}")
+
+        # One row per category, so a plain loop beats a NumPy round-trip;
+        # the total already comes from SQL, only the scale is hoisted
+        fa = "₹{:.2f}".format
+        fp = "{:.1f}%".format
+        scale = 100.0 / total if total else 0.0
+        self.fill_tree(self._report_tree, (
+            (cat, fa(amount), fp(amount * scale))
+            for cat, amount in category_summary
+        ))
+
+    def build_report_window(self):
+        """Create the report window once; later reports only refill it."""
         report_win = tk.Toplevel(self.root)
-        report_win.title(f"Report - {datetime(year, month, 1).strftime('%B %Y')}")
         report_win.geometry("600x500")
+        # Hide instead of destroy so the next report can reuse the widgets
+        report_win.protocol("WM_DELETE_WINDOW", report_win.withdraw)
 
         tk.Label(report_win, text="Expense Report",
                  font=('Arial', 18, 'bold')).pack(pady=20)
 
-        tk.Label(report_win, text=datetime(year, month, 1).strftime('%B %Y'),
-                 font=('Arial', 14)).pack()
+        self._report_month_label = tk.Label(report_win, font=('Arial', 14))
+        self._report_month_label.pack()
 
-        total = sum(t[3] for t in transactions)
         summary_frame = tk.Frame(report_win, bd=1, relief='solid')
         summary_frame.pack(fill='x', padx=20, pady=20)
 
-        tk.Label(summary_frame, text=f"Total Expenses: ₹{total:.2f}",
-                 font=('Arial', 14, 'bold'), fg="red").pack(pady=10)
-        tk.Label(summary_frame, text=f"Number of Transactions: {len(transactions)}",
-                 font=('Arial', 12)).pack(pady=5)
+        self._report_total_label = tk.Label(summary_frame, font=('Arial', 14, 'bold'), fg="red")
+        self._report_total_label.pack(pady=10)
+        self._report_count_label = tk.Label(summary_frame, font=('Arial', 12))
+        self._report_count_label.pack(pady=5)
 
         tk.Label(report_win, text="Category Breakdown",
                  font=('Arial', 13, 'bold')).pack(pady=(20, 10))
@@ -635,112 +1163,283 @@ class ExpenseTrackerGUI:
 
         cat_tree.pack(fill='both', expand=True)
 
-        for cat, amount in category_summary:
-            percentage = (amount / total) * 100 if total else 0
-            cat_tree.insert('', 'end', values=(cat, f'₹{amount:.2f}', f'{percentage:.1f}%'))
+        self._report_win = report_win
+        self._report_tree = cat_tree
 
 
     #  VISUALIZATION (CHARTS)
    
     def show_visualization(self):
-        """Show pie, bar, daily line chart and stats in a new window."""
-        year = int(self.year_var.get())
-        month = int(self.month_var.get())
-
-        transactions = self.db.get_transactions_by_month(year, month)
-        category_summary = self.db.get_category_summary(year, month)
+        """Show pie, bar, daily line chart and stats in a reusable window."""
+        selected = self.selected_month()
+        if selected is None:
+            return
+        year, month = selected
 
-        if not transactions:
-            messagebox.showinfo("Info", "No data to visualize for this month!")
+        if self._viz_job is not None:
+            # Figures are not thread-safe: draw again once the pending job
+            # lands instead of blocking the Tk thread on it
+            self._viz_redraw = True
             return
 
-        viz_win = tk.Toplevel(self.root)
-        viz_win.title(f"Spending Analysis - {datetime(year, month, 1).strftime('%B %Y')}")
-        viz_win.geometry("1000x800")
+        # Query, draw and rasterise on the I/O pool; Tk keeps handling events
+        self._viz_job = self._io_pool.submit(
+            self.draw_viz, year, month, self.dark_mode, self.viz_target_size())
+        self.root.after(20, self.show_viz_result, self._viz_job)
 
-        # Apply dark or light style to charts
-        if self.dark_mode:
-            plt.style.use("dark_background")
+    def draw_viz(self, year, month, dark, size):
+        """
+        Draw one month into the chart figure and rasterise it. Runs on the
+        I/O pool and touches no Tk objects. Returns None for an empty month,
+        else (month name, image); the image is None if nothing changed.
+        """
+        category_summary, daily_totals, stats = self.db.get_month_snapshot(year, month)
+        if not stats.count:
+            return None
+        month_name = datetime(year, month, 1).strftime('%B %Y')
+        # Everything drawn comes from these aggregates; no raw rows are fetched
+        key = (year, month, category_summary, daily_totals, stats)
+
+        if self._viz_fig is None or self._viz_dark != dark:
+            self.build_viz_figure(dark)
+        elif self._viz_key == key and self._viz_size == size:
+            # Same data: the label still shows the right image, no redraw
+            return month_name, None
         else:
-            plt.style.use("default")
+            # The pie is rebuilt; bars, line and stats text are updated in place
+            self._viz_axes[0][0].cla()
 
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 10))
-        fig.suptitle(f'Expense Analysis - {datetime(year, month, 1).strftime("%B %Y")}',
+        fig = self._viz_fig
+        (ax1, ax2), (ax3, ax4) = self._viz_axes
+        fig.suptitle(f'Expense Analysis - {month_name}',
                      fontsize=16, fontweight='bold')
 
         # Pie chart
+        # One float64 array shared by the pie and bar (no per-chart conversion)
+        import numpy as np
         categories = [cat for cat, _ in category_summary]
-        amounts = [amt for _, amt in category_summary]
-        colors = plt.cm.Set3(range(len(categories))) if categories else None
+        amounts = np.fromiter(map(itemgetter(1), category_summary), dtype=np.float64,
+                              count=len(category_summary))
+        # Imported CSVs may carry categories outside the fixed list
+        other = CATEGORY_COLORS['Other']
+        colors = [CATEGORY_COLORS.get(cat, other) for cat in categories]
 
         if categories:
-            ax1.pie(amounts, labels=categories, autopct='%1.1f%%',
-                    colors=colors, startangle=90)
+            # Percentages go into the labels up front: one Text per wedge
+            # and no autopct callback at draw time
+            shares = amounts * (100.0 / amounts.sum())
+            labels = [f"{cat} ({pct:.1f}%)" for cat, pct in zip(categories, shares.tolist())]
+            ax1.pie(amounts, labels=labels, colors=colors, startangle=90)
             ax1.set_title('Spending by Category')
         else:
             ax1.text(0.5, 0.5, "No category data", ha="center", va="center")
             ax1.set_axis_off()
 
-        # Bar chart
-        if categories:
-            ax2.barh(categories, amounts, color=colors)
+        # Bar chart: same categories in the same order only need new widths
+        fa = " ₹{:.2f}".format
+        if self._viz_bars is not None and self._viz_bars[0] == categories:
+            _, bars, labels = self._viz_bars
+            for bar, label, v in zip(bars, labels, amounts):
+                bar.set_width(v)
+                label.set_x(v)
+                label.set_text(fa(v))
+            ax2.relim()
+            ax2.autoscale_view()
+        elif categories:
+            ax2.cla()
+            bars = ax2.barh(categories, amounts, color=colors)
             ax2.set_xlabel('Amount (₹)')
             ax2.set_title('Category Comparison')
             ax2.invert_yaxis()
-            for i, v in enumerate(amounts):
-                ax2.text(v, i, f' ₹{v:.2f}', va='center')
+            labels = [ax2.text(v, i, fa(v), va='center') for i, v in enumerate(amounts)]
+            self._viz_bars = (categories, bars, labels)
         else:
+            ax2.cla()
+            self._viz_bars = None
             ax2.text(0.5, 0.5, "No data", ha="center", va="center")
             ax2.set_axis_off()
 
-    # Daily spending line chart
-        daily_spending = defaultdict(float)
-        for t in transactions:
-            daily_spending[t[1]] += t[3]
+        # Daily spending line chart
+        dates, daily_amounts = zip(*daily_totals)
+        self._viz_line.set_data([date.fromisoformat(d) for d in dates], daily_amounts)
+        ax3.set_xlim(*(date.fromisoformat(d) for d in month_bounds(year, month)))
+        ax3.relim()
+        ax3.autoscale_view(scalex=False)
 
-        dates = sorted(daily_spending.keys())
-        daily_amounts = [daily_spending[d] for d in dates]
-
-        ax3.plot(dates, daily_amounts, marker='o', linestyle='-', linewidth=2, markersize=6)
-        ax3.set_xlabel('Date')
-        ax3.set_ylabel('Amount (₹)')
-        ax3.set_title('Daily Spending Pattern')
-        ax3.tick_params(axis='x', rotation=45)
-        ax3.grid(True, alpha=0.3)
-
-
-        ax4.axis('off')
-        total = sum(amounts) if amounts else sum(t[3] for t in transactions)
-        avg_per_transaction = total / len(transactions) if transactions else 0
-        max_transaction = max(t[3] for t in transactions) if transactions else 0
         top_cat = categories[0] if categories else "N/A"
 
         stats_text = f"""
 SUMMARY STATISTICS
 {'─' * 30}
 
-Total Spending:        ₹{total:,.2f}
+Total Spending:        ₹{stats.total:,.2f}
 
-Transactions:          {len(transactions)}
+Transactions:          {stats.count}
 
-Average/Transaction:   ₹{avg_per_transaction:.2f}
+Average/Transaction:   ₹{stats.average:.2f}
 
-Largest Transaction:   ₹{max_transaction:.2f}
+Largest Transaction:   ₹{stats.largest:.2f}
 
 Top Category:          {top_cat}
         """
-        ax4.text(0.05, 0.5, stats_text, fontsize=11, family='monospace',
-                 verticalalignment='center')
+        self._viz_stats.set_text(stats_text)
+
+        self._viz_key = key
+        return month_name, self.rasterise_viz(size)
+
+    def rasterise_viz(self, size):
+        """Render the chart figure at size (pixels); runs on the I/O pool."""
+        fig = self._viz_fig
+        fig.set_size_inches(size[0] / fig.dpi, size[1] / fig.dpi)
+        self._viz_size = size
+        return render_figure(fig, self._viz_canvas)
+
+    def viz_target_size(self):
+        """Pixel size to render at: the chart label's, or the default window's."""
+        label = self._viz_label
+        if label is not None and label.winfo_exists():
+            width, height = label.winfo_width(), label.winfo_height()
+            if width > 1 and height > 1:
+                return width, height
+        return 1000, 800    # not built or not mapped yet
+
+    def render_viz(self):
+        """Re-rasterise the current figure at the label's size on the I/O pool."""
+        self._viz_resize_job = None
+        if self._viz_fig is None:
+            return
+        if self._viz_job is not None:
+            # A draw not shown yet carries the title or the "no data"
+            # message; let it land rather than superseding it
+            self._viz_resize_job = self.root.after(150, self.render_viz)
+            return
+        size = self.viz_target_size()
+        self._viz_job = self._io_pool.submit(lambda: (None, self.rasterise_viz(size)))
+        self.root.after(20, self.show_viz_result, self._viz_job)
+
+    def show_viz_result(self, job):
+        """Show a finished draw/render job (Tk objects stay on this thread)."""
+        if not job.done():
+            self.root.after(20, self.show_viz_result, job)
+            return
+        if job is not self._viz_job:
+            return      # superseded by a newer draw
+        self._viz_job = None
+        if self._viz_redraw:
+            # A newer click is waiting; it supersedes this result
+            self._viz_redraw = False
+            self.show_visualization()
+            return
 
-        plt.tight_layout()
+        try:
+            result = job.result()
+        except Exception as e:
+            messagebox.showerror("Visualization", f"Error: {e}")
+            return
+        if result is None:
+            messagebox.showinfo("Info", "No data to visualize for this month!")
+            return
+        month_name, image = result
+
+        if self._viz_win is None or not self._viz_win.winfo_exists():
+            self.build_viz_window()
+            if image is None:   # figure is current but the new label is empty
+                self.render_viz()
+        if month_name is not None:
+            self._viz_win.title(f"Spending Analysis - {month_name}")
+            self._viz_win.deiconify()
+            self._viz_win.lift()
+        if image is not None:
+            from PIL import ImageTk
+            self._viz_image = ImageTk.PhotoImage(image, master=self._viz_label)
+            self._viz_label.configure(image=self._viz_image)
+
+    def on_viz_resize(self, event):
+        """Re-render at the new size once the user stops resizing."""
+        if (event.width, event.height) == self._viz_size:
+            return
+        if self._viz_resize_job is not None:
+            self.root.after_cancel(self._viz_resize_job)
+        self._viz_resize_job = self.root.after(150, self.render_viz)
+
+    def build_viz_window(self):
+        """Create the chart window and its image label once for reuse."""
+        viz_win = tk.Toplevel(self.root)
+        viz_win.geometry("1000x800")
+        # Hide instead of destroy so the window survives until next time
+        viz_win.protocol("WM_DELETE_WINDOW", viz_win.withdraw)
 
-        canvas = FigureCanvasTkAgg(fig, master=viz_win)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
+        # The figure is rendered off-screen and shown as an image in a Label
+        label = tk.Label(viz_win)
+        label.pack(fill='both', expand=True)
+        label.bind('<Configure>', self.on_viz_resize)
+
+        self._viz_win = viz_win
+        self._viz_label = label
+
+    def build_viz_figure(self, dark):
+        """Create the chart figure and Agg canvas; Tk-free, runs on the I/O pool."""
+        matplotlib, Figure, FigureCanvasAgg, AutoDateLocator = load_matplotlib()
+
+        # Apply dark or light style to charts
+        if dark:
+            matplotlib.style.use("dark_background")
+        else:
+            matplotlib.style.use("default")
+
+        # 80 dpi: text and markers cost fewer pixels at the same window size
+        fig = Figure(figsize=(12.5, 10), dpi=80)
+        axes = fig.subplots(2, 2)
+        ax3, ax4 = axes[1]
+
+        # Artists that persist across redraws; draw_viz sets their data
+        ax3.xaxis_date()
+        # At most 6 date ticks instead of one per few days of the month
+        ax3.xaxis.set_major_locator(AutoDateLocator(minticks=3, maxticks=6))
+        self._viz_line, = ax3.plot([], [], marker='o', linestyle='-', linewidth=2, markersize=6)
+        ax3.set_xlabel('Date')
+        ax3.set_ylabel('Amount (₹)')
+        ax3.set_title('Daily Spending Pattern')
+        ax3.tick_params(axis='x', rotation=45)
+        ax3.grid(True, alpha=0.3)
+
+        ax4.axis('off')
+        self._viz_stats = ax4.text(0.05, 0.5, "", fontsize=11, family='monospace',
+                                   verticalalignment='center')
 
+        self._viz_fig = fig
+        self._viz_canvas = FigureCanvasAgg(fig)
+        self._viz_axes = axes
+        self._viz_dark = dark
+        self._viz_key = None
+        self._viz_bars = None
+
+
+    def import_csv(self):
+        """Import transactions from a CSV laid out like Export CSV produces."""
+        file_path = filedialog.askopenfilename(
+            filetypes=[("CSV files", "*.csv")]
+        )
+        if not file_path:
+            return
+
+        try:
+            with open(file_path, newline="", encoding="utf-8") as f:
+                rows = parse_csv_rows(f)
+            count = self.db.add_transactions(rows)
+            messagebox.showinfo("Import CSV", f"Imported {count} transactions from {file_path}")
+        except Exception as e:
+            messagebox.showerror("Import CSV", f"Error: {e}")
+            return
+
+        self.schedule_refresh()
 
     def export_csv(self):
         """Export current table view to CSV."""
+        if not self.tree.get_children():
+            messagebox.showinfo("Export CSV", "There are no transactions to export.")
+            return
+
         file_path = filedialog.asksaveasfilename(
             defaultextension=".csv",
             filetypes=[("CSV files", "*.csv")]
@@ -752,16 +1451,25 @@ Top Category:          {top_cat}
             with open(file_path, "w", newline="", encoding="utf-8") as f:
                 writer = csv.writer(f)
                 writer.writerow(["ID", "Date", "Category", "Amount (₹)", "Description"])
-                for item in self.tree.get_children():
-                    row = self.tree.item(item)["values"]
-                    writer.writerow(row)
+                # The whole view, not just the pages scrolled so far
+                writer.writerows(self.view_rows())
             messagebox.showinfo("Export CSV", f"Data exported to {file_path}")
         except Exception as e:
             messagebox.showerror("Export CSV", f"Error: {e}")
 
     def export_pdf(self):
         """Export current table view as a simple PDF report (if reportlab is available)."""
-        if not REPORTLAB_AVAILABLE:
+        if not self.tree.get_children():
+            messagebox.showinfo("Export PDF", "There are no transactions to export.")
+            return
+
+        # PDF export is optional, handled safely if reportlab is missing
+        try:
+            from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+            from reportlab.lib import colors
+            from reportlab.lib.pagesizes import A4, landscape
+            from reportlab.lib.styles import getSampleStyleSheet
+        except ImportError:
             messagebox.showwarning(
                 "Export PDF",
                 "reportlab is not installed.\nInstall it using:\n\npip install reportlab"
@@ -777,9 +1485,7 @@ Top Category:          {top_cat}
 
         # Collect data from treeview
         data = [["ID", "Date", "Category", "Amount (₹)", "Description"]]
-        for item in self.tree.get_children():
-            row = self.tree.item(item)["values"]
-            data.append([str(x) for x in row])
+        data.extend([str(x) for x in row] for row in self.view_rows())
 
         try:
             doc = SimpleDocTemplate(file_path, pagesize=landscape(A4))
@@ -807,6 +1513,7 @@ Top Category:          {top_cat}
 
 
     def on_closing(self):
+        self._io_pool.shutdown(wait=True)
         self.db.close()
         self.root.destroy()
 
@@ -1,16 +1,39 @@
+import importlib.util
+import io
+import os
+import sqlite3
+import tempfile
 import unittest
-from datetime import datetime
-from trail import ExpenseTracker
+from datetime import date, datetime
+from unittest import mock
+from main import (ExpenseTrackerDB as ExpenseTracker, ExpenseTrackerGUI, MONTH_CACHE_SIZE,
+                  month_bounds, parse_csv_rows)
 
 class TestExpenseTracker(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Schema is built once; each test gets a copy via the backup API
+        cls._template = sqlite3.connect(":memory:")
+        ExpenseTracker.create_tables_static(cls._template)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._template.close()
+
     def setUp(self):
-        self.tracker = ExpenseTracker(db_name=":memory:")
+        # create=False: the schema (DDL + ANALYZE) comes from the template
+        self.tracker = ExpenseTracker(db_name=":memory:", fast=True, create=False)
+        self._template.backup(self.tracker.conn)
 
     def tearDown(self):
         
         self.tracker.close()
 
+    def _seed(self, rows):
+        """Insert fixture rows in one transaction (one commit)"""
+        self.tracker.add_transactions(rows)
+
     def test_add_transaction(self):
         """Test if transactions are inserted correctly"""
         trans_id = self.tracker.add_transaction(
@@ -26,24 +49,137 @@ class TestExpenseTracker(unittest.TestCase):
         self.assertEqual(rows[0][2], "Food")
         self.assertEqual(rows[0][3], 150.0)
 
+    def test_add_transactions_batch(self):
+        """Test bulk insert in one transaction, and rollback on a bad row"""
+        count = self.tracker.add_transactions([
+            ("2025-01-10", "Food", 150.0, "Lunch"),
+            ("2025-01-11", "Transport", 40.0, "Bus"),
+        ])
+        self.assertEqual(count, 2)
+        self.assertEqual(len(self.tracker.get_all_transactions()), 2)
+
+        with self.assertRaises(Exception):
+            self.tracker.add_transactions([
+                ("2025-01-12", "Food", 10.0, ""),
+                ("2025-01-12", None, 20.0, ""),
+            ])
+        self.assertEqual(len(self.tracker.get_all_transactions()), 2)
+
+    def test_add_transactions_chunked(self):
+        """Test bulk insert across multi-VALUES chunks plus a remainder"""
+        rows = [("2025-01-%02d" % (i % 28 + 1), "Food", i, "") for i in range(250)]
+        self.assertEqual(self.tracker.add_transactions(iter(rows)), 250)
+        self.assertEqual(self.tracker.get_totals(), (sum(range(250)), 250))
+
+        # A row with the wrong arity is rejected, not shifted into its neighbours
+        rows[50] = ("2025-01-01", "Food", 1)
+        with self.assertRaises(ValueError):
+            self.tracker.add_transactions(rows)
+        self.assertEqual(self.tracker.get_totals(), (sum(range(250)), 250))
+
     def test_get_transactions_by_month(self):
         """Test month filtering"""
         # Insert sample transactions
-        self.tracker.add_transaction("2025-02-05", "Food", 100, "")
-        self.tracker.add_transaction("2025-02-14", "Transport", 200, "")
-        self.tracker.add_transaction("2025-03-01", "Food", 300, "")
+        self._seed([
+            ("2025-02-05", "Food", 100, ""),
+            ("2025-02-14", "Transport", 200, ""),
+            ("2025-03-01", "Food", 300, ""),
+        ])
 
         feb_trans = self.tracker.get_transactions_by_month(2025, 2)
         self.assertEqual(len(feb_trans), 2)
 
         mar_trans = self.tracker.get_transactions_by_month(2025, 3)
         self.assertEqual(len(mar_trans), 1)
+        self.assertEqual(mar_trans[0][3], 300)
+
+    def test_transactions_page(self):
+        """Test LIMIT/OFFSET pages cover every row once, newest first"""
+        self._seed([("2025-01-01", "Food", i, "") for i in range(5)] + [("2025-02-01", "Food", 99, "")])
+
+        first = self.tracker.get_transactions_page(2)
+        self.assertEqual(first[0][1], "2025-02-01")
+        self.assertEqual(first[0][3], 99)
+        rest = self.tracker.get_transactions_page(-1, 2)
+        ids = [r[0] for r in first + rest]
+        self.assertEqual(sorted(ids), sorted(r[0] for r in self.tracker.get_all_transactions()))
+        self.assertEqual(len(set(ids)), 6)
+
+    def test_amount_formatting_matches_across_views(self):
+        """Test page, month, search and export rows format amounts alike"""
+        self._seed([("2025-01-01", "Food", 2.675, "lunch"), ("2025-01-02", "Food", 1.005, "")])
+
+        def amounts(rows):
+            return sorted(row[3] for row in ExpenseTrackerGUI.format_rows(rows))
+
+        expected = ["₹1.00", "₹2.67"]      # what "{:.2f}" gives, unlike printf
+        self.assertEqual(amounts(self.tracker.get_transactions_page(-1)), expected)
+        self.assertEqual(amounts(self.tracker.get_transactions_by_month(2025, 1)), expected)
+        self.assertEqual(amounts(self.tracker.iter_all_transactions()), expected)
+        self.assertEqual(amounts(self.tracker.search("food")), expected)
+
+    def test_parse_csv_rows(self):
+        """Test reading the Export CSV layout, and rejecting bad lines"""
+        exported = (
+            "ID,Date,Category,Amount (₹),Description\r\n"
+            "7,2025-01-05,Food,₹2.67,lunch\r\n"
+            "8,2025-01-06,Bills,\"₹1,200.00\",\r\n"
+        )
+        rows = parse_csv_rows(io.StringIO(exported))
+        self.assertEqual(rows, [("2025-01-05", "Food", 2.67, "lunch"),
+                                ("2025-01-06", "Bills", 1200.0, "")])
+        self._seed(rows)
+        self.assertEqual(self.tracker.get_totals_by_month(2025, 1), (1202.67, 2))
+
+        header = "ID,Date,Category,Amount (₹),Description\n"
+        with self.assertRaisesRegex(ValueError, "line 3"):
+            parse_csv_rows(io.StringIO(header + "1,2025-01-05,Food,₹5.00,\n2,2025-01-5,Food,₹5.00,\n"))
+        with self.assertRaisesRegex(ValueError, "line 2: amount must be positive"):
+            parse_csv_rows(io.StringIO(header + "1,2025-01-05,Food,₹-5.00,\n"))
+        with self.assertRaisesRegex(ValueError, "line 2"):
+            parse_csv_rows(io.StringIO(header + "1,2025-01-05,Food,abc,\n"))
+
+    def test_iter_all_transactions(self):
+        """Test streaming in chunks yields the same rows as fetchall"""
+        self._seed([("2025-01-%02d" % (i % 28 + 1), "Food", i, "") for i in range(25)])
+
+        streamed = list(self.tracker.iter_all_transactions(chunk=10))
+        self.assertEqual(streamed, self.tracker.get_all_transactions())
+
+    def test_month_bounds_december_rollover(self):
+        """Test month bounds roll over into the next year"""
+        self.assertEqual(month_bounds(2025, 12), ("2025-12-01", "2026-01-01"))
+        self.assertEqual(month_bounds(2025, 2), ("2025-02-01", "2025-03-01"))
+
+        self._seed([
+            ("2025-12-31", "Food", 100, ""),
+            ("2026-01-01", "Food", 200, ""),
+        ])
+
+        dec_trans = self.tracker.get_transactions_by_month(2025, 12)
+        self.assertEqual(len(dec_trans), 1)
+
+    def test_totals(self):
+        """Test SQL-side sum/count, overall and per month"""
+        self.assertEqual(self.tracker.get_totals(), (0, 0))
+
+        self._seed([
+            ("2025-02-05", "Food", 100, ""),
+            ("2025-02-14", "Transport", 200, ""),
+            ("2025-03-01", "Food", 300, ""),
+        ])
+
+        self.assertEqual(self.tracker.get_totals(), (600, 3))
+        self.assertEqual(self.tracker.get_totals_by_month(2025, 2), (300, 2))
+        self.assertEqual(self.tracker.get_totals_by_month(2025, 4), (0, 0))
 
     def test_category_summary(self):
         """Test category-wise summary"""
-        self.tracker.add_transaction("2025-01-01", "Food", 50, "")
-        self.tracker.add_transaction("2025-01-01", "Food", 50, "")
-        self.tracker.add_transaction("2025-01-01", "Transport", 100, "")
+        self._seed([
+            ("2025-01-01", "Food", 50, ""),
+            ("2025-01-01", "Food", 50, ""),
+            ("2025-01-01", "Transport", 100, ""),
+        ])
 
         summary = self.tracker.get_category_summary(2025, 1)
 
@@ -52,6 +188,131 @@ class TestExpenseTracker(unittest.TestCase):
         self.assertEqual(summary_dict["Food"], 100)
         self.assertEqual(summary_dict["Transport"], 100)
 
+    def test_month_stats(self):
+        """Test total/largest/count/average from one query"""
+        self._seed([
+            ("2025-01-03", "Food", 50, ""),
+            ("2025-01-09", "Bills", 250, ""),
+            ("2025-02-01", "Food", 99, ""),
+        ])
+
+        stats = self.tracker.get_month_stats(2025, 1)
+        self.assertEqual(stats.total, 300)
+        self.assertEqual(stats.largest, 250)
+        self.assertEqual(stats.count, 2)
+        self.assertEqual(stats.average, 150)
+
+        self.assertEqual(self.tracker.get_month_stats(2025, 3).count, 0)
+
+    def test_month_cache_invalidated_on_write(self):
+        """Test cached month results are dropped by update and delete"""
+        trans_id = self.tracker.add_transaction("2025-01-03", "Food", 50, "")
+        self.assertEqual(self.tracker.get_totals_by_month(2025, 1), (50, 1))
+
+        self.tracker.update_transaction(trans_id, "2025-01-03", "Food", 80, "")
+        self.assertEqual(self.tracker.get_totals_by_month(2025, 1), (80, 1))
+
+        self.tracker.delete_transaction(trans_id)
+        self.assertEqual(self.tracker.get_totals_by_month(2025, 1), (0, 0))
+
+    def test_month_cache_sees_other_connections(self):
+        """Test a commit from another connection drops cached month results"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "shared.db")
+            with ExpenseTracker(db_name=path) as tracker:
+                tracker.add_transaction("2025-01-03", "Food", 50, "")
+                self.assertEqual(tracker.get_totals_by_month(2025, 1), (50, 1))
+
+                other = sqlite3.connect(path)
+                with other:
+                    other.execute("INSERT INTO transactions (date, category, amount, description)"
+                                  " VALUES ('2025-01-04', 'Food', 100, '')")
+                other.close()
+
+                self.assertEqual(tracker.get_totals_by_month(2025, 1), (150, 2))
+                self.assertEqual(len(tracker.get_transactions_by_month(2025, 1)), 2)
+
+    def test_month_cache_is_bounded(self):
+        """Test the month cache keeps at most MONTH_CACHE_SIZE entries"""
+        for month in range(1, 13):
+            for year in (2023, 2024, 2025):
+                self.tracker.get_totals_by_month(year, month)
+        self.assertEqual(len(self.tracker._month_cache), MONTH_CACHE_SIZE)
+
+    def test_data_signature(self):
+        """Test the signature moves on writes and stays put on reads"""
+        sig = self.tracker.data_signature()
+        self.tracker.get_all_transactions()
+        self.assertEqual(self.tracker.data_signature(), sig)
+
+        trans_id = self.tracker.add_transaction("2025-01-03", "Food", 50, "")
+        self.assertNotEqual(self.tracker.data_signature(), sig)
+
+        sig = self.tracker.data_signature()
+        self.tracker.update_transaction(trans_id, "2025-01-03", "Food", 50, "edited")
+        self.assertNotEqual(self.tracker.data_signature(), sig)
+
+    def test_daily_totals(self):
+        """Test per-day sums for a month, in date order"""
+        self._seed([
+            ("2025-01-03", "Food", 50, ""),
+            ("2025-01-01", "Food", 20, ""),
+            ("2025-01-03", "Transport", 25, ""),
+            ("2025-02-01", "Food", 99, ""),
+        ])
+
+        daily = self.tracker.get_daily_totals(2025, 1)
+        self.assertEqual(daily, [("2025-01-01", 20), ("2025-01-03", 75)])
+
+    def test_month_report(self):
+        """Test grand total, count and breakdown from one query"""
+        self.assertEqual(self.tracker.get_month_report(2025, 1), (0, 0, []))
+
+        self._seed([
+            ("2025-01-01", "Food", 50, ""),
+            ("2025-01-02", "Food", 50, ""),
+            ("2025-01-03", "Transport", 300, ""),
+            ("2025-02-01", "Food", 99, ""),
+        ])
+
+        total, count, summary = self.tracker.get_month_report(2025, 1)
+        self.assertEqual(total, 400)
+        self.assertEqual(count, 3)
+        self.assertEqual(summary, [("Transport", 300), ("Food", 100)])
+
+    def test_month_snapshot(self):
+        """Test summary, daily totals and stats come back together"""
+        self._seed([
+            ("2025-01-01", "Food", 50, ""),
+            ("2025-01-03", "Bills", 150, ""),
+        ])
+
+        summary, daily, stats = self.tracker.get_month_snapshot(2025, 1)
+        self.assertEqual(summary, [("Bills", 150), ("Food", 50)])
+        self.assertEqual(daily, [("2025-01-01", 50), ("2025-01-03", 150)])
+        self.assertEqual((stats.total, stats.count), (200, 2))
+        self.assertFalse(self.tracker.conn.in_transaction)
+
+    def test_month_snapshot_ignores_stale_cache(self):
+        """Test the snapshot's three parts agree after an outside commit"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "shared.db")
+            with ExpenseTracker(db_name=path) as tracker:
+                tracker.add_transaction("2025-01-03", "Food", 50, "")
+                tracker.get_month_snapshot(2025, 1)
+                tracker.get_category_summary(2025, 1)
+
+                other = sqlite3.connect(path)
+                with other:
+                    other.execute("INSERT INTO transactions (date, category, amount, description)"
+                                  " VALUES ('2025-01-04', 'Bills', 100, '')")
+                other.close()
+
+                summary, daily, stats = tracker.get_month_snapshot(2025, 1)
+                self.assertEqual(sum(total for _, total in summary), stats.total)
+                self.assertEqual(sum(total for _, total in daily), stats.total)
+                self.assertEqual((stats.total, stats.count), (150, 2))
+
     def test_delete_transaction(self):
         """Test deleting a transaction"""
         trans_id = self.tracker.add_transaction("2025-01-01", "Bills", 500, "")
@@ -62,6 +323,67 @@ class TestExpenseTracker(unittest.TestCase):
         rows = self.tracker.get_all_transactions()
         self.assertEqual(len(rows), 0)
 
+    def test_delete_transactions(self):
+        """Test deleting several transactions at once"""
+        ids = [self.tracker.add_transaction("2025-01-0%d" % d, "Bills", d, "") for d in (1, 2, 3)]
+
+        self.assertEqual(self.tracker.delete_transactions(ids[:2]), 2)
+        self.assertEqual(self.tracker.delete_transactions([]), 0)
+
+        rows = self.tracker.get_all_transactions()
+        self.assertEqual([r[0] for r in rows], [ids[2]])
+
+    def test_close_twice_and_context_manager(self):
+        """Test close is idempotent and the tracker works as a context manager"""
+        with ExpenseTracker(db_name=":memory:") as tracker:
+            tracker.add_transaction("2025-01-01", "Food", 10, "")
+        self.assertIsNone(tracker.conn)
+        tracker.close()
+
+    def test_close_unregisters_atexit_hook(self):
+        """Test closing drops the atexit hook that would keep the tracker alive"""
+        tracker = ExpenseTracker(db_name=":memory:")
+        with mock.patch("main.atexit.unregister") as unregister:
+            tracker.close()
+        unregister.assert_called_once_with(tracker.close)
+
+
+
+class TestUsdMonthlyTrend(unittest.TestCase):
+    """The USD script has no package name, so it is loaded from its path"""
+
+    @classmethod
+    def setUpClass(cls):
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main(in USD).py")
+        spec = importlib.util.spec_from_file_location("main_usd", path)
+        cls.usd = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(cls.usd)
+
+    def _trend(self):
+        tracker = self.usd.ExpenseTracker(db_name=":memory:")
+        try:
+            for day, amount in (("2025-08-31", 1), ("2025-09-01", 2), ("2025-12-31", 4),
+                                ("2026-01-01", 8), ("2026-01-20", 16), ("2026-02-15", 32)):
+                tracker.add_transaction(day, "Food", amount, "")
+            return tracker.get_monthly_trend(6, today=date(2026, 2, 20))
+        finally:
+            tracker.close()
+
+    def test_trend_crosses_year_boundary(self):
+        """Test six months ending in February span the new year, oldest first"""
+        expected = [("2025-09", 2), ("2025-12", 4), ("2026-01", 24), ("2026-02", 32)]
+        self.assertEqual(self._trend(), expected)
+
+        # Without generated columns the trend groups by the expression instead
+        with mock.patch.object(self.usd, "HAS_GENERATED_COLUMNS", False):
+            self.assertEqual(self._trend(), expected)
+
+    def test_trend_labels_round_trip(self):
+        """Test each YYYY-MM label parses back to its own month"""
+        for label, _ in self._trend():
+            month = datetime.strptime(label, "%Y-%m")
+            self.assertEqual(month.strftime("%Y-%m"), label)
+
 
 if __name__ == "__main__":
     unittest.main()